@@ -1,128 +1,387 @@
 import streamlit as st
-import requests
+import asyncio
+import aiohttp
+import atexit
+import httpx
+import re
+import threading
 import time
-from fuzzywuzzy import fuzz, process
+import uuid
+from operator import itemgetter
+from typing import NamedTuple, Optional
+import numpy as np
+import pandas as pd
+import orjson
+from rapidfuzz import fuzz, process, utils
+from streamlit_autorefresh import st_autorefresh
 
 # Constants
 GAMMA_API = "https://gamma-api.polymarket.com/markets"
-CLOB_ORDERBOOK = "https://clob.polymarket.com/orderbook"
+CLOB_HOST = "https://clob.polymarket.com"
+CLOB_BOOKS = f"{CLOB_HOST}/books"
+CLOB_WS = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+LIVE_REFRESH_SECS = 1
+FEED_RECONNECT_SECS = 5
+FEED_IDLE_SECS = 30
 
-def fetch_all_markets():
+HTTP_HEADERS = {"Accept": "application/json"}
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+RETRY_STATUSES = {429, 502, 503, 504}
+RETRIES = 3
+BACKOFF_FACTOR = 0.3
+PAGE_LIMIT = 500
+PAGE_CONCURRENCY = 8
+BOOKS_CHUNK = 250
+BOOK_CONCURRENCY = 8
+MARKETS_TTL = 300
+QUOTES_TTL = 10
+MATCH_BLOCK = 1000
+
+@st.cache_resource
+def get_event_loop():
+    # One background loop per process, shared by every scan and the live feed
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+def run_async(coro):
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+@st.cache_resource
+def get_http_client():
+    # Long-lived so pooled HTTP/2 connections to Gamma and the CLOB survive from one scan to the next
+    # No transport-level retries: request_with_retry is the single retry layer
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS)
+    client = httpx.AsyncClient(transport=transport, headers=HTTP_HEADERS)
+    # At exit the cache_resource registry may already be torn down, so close on the loop captured now
+    loop = get_event_loop()
+    atexit.register(lambda: asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5))
+    return client
+
+async def request_with_retry(client, method, url, **kwargs):
+    # Rate limits, gateway errors and dropped connections get a few tries with exponential
+    # backoff; anything else, or the last failure, is raised as an httpx.HTTPError
+    for attempt in range(RETRIES):
+        try:
+            resp = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if attempt == RETRIES - 1:
+                raise
+        else:
+            if resp.status_code not in RETRY_STATUSES or attempt == RETRIES - 1:
+                resp.raise_for_status()
+                return resp
+        await asyncio.sleep(BACKOFF_FACTOR * 2 ** attempt)
+
+def parse_token_ids(markets):
+    # Gamma sends clobTokenIds as a JSON-encoded string; decode it once so later checks see a list
+    for m in markets:
+        raw = m.get("clobTokenIds")
+        m["clobTokenIds"] = orjson.loads(raw) if isinstance(raw, str) else (raw or [])
+    return markets
+
+async def fetch_markets_page(client, offset):
+    params = {"active": "true", "closed": "false", "limit": PAGE_LIMIT, "offset": offset}
+    resp = await request_with_retry(client, "GET", GAMMA_API, params=params)
+    # A 200 with a bad body is reported like any other API failure
+    try:
+        return parse_token_ids(orjson.loads(resp.content))
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise httpx.DecodingError(f"Malformed markets page at offset {offset}: {e!r}", request=resp.request) from e
+
+async def fetch_market_pages(client):
+    # Offsets are independent, so request PAGE_CONCURRENCY pages at once and keep going until a short page shows up
     markets = []
     offset = 0
-    limit = 500
     while True:
-        params = {"active": "true", "closed": "false", "limit": limit, "offset": offset}
-        resp = requests.get(GAMMA_API, params=params)
-        if resp.status_code != 200:
-            st.error(f"API Error: {resp.status_code}")
-            return []
-        data = resp.json()
-        markets.extend(data)
-        if len(data) < limit:
-            break
-        offset += limit
-    return markets
+        offsets = range(offset, offset + PAGE_LIMIT * PAGE_CONCURRENCY, PAGE_LIMIT)
+        for data in await asyncio.gather(*[fetch_markets_page(client, o) for o in offsets]):
+            markets.extend(data)
+            if len(data) < PAGE_LIMIT:
+                return markets
+        offset += PAGE_LIMIT * PAGE_CONCURRENCY
+
+# The market universe changes over hours while prices move by the second, so they get separate TTLs
+@st.cache_data(ttl=MARKETS_TTL, show_spinner=False)
+def fetch_all_markets():
+    # Errors propagate so a failed crawl is never cached; the caller reports them
+    return run_async(fetch_market_pages(get_http_client()))
+
+def chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+async def fetch_books(client, token_ids):
+    # /books takes a batch of token ids and returns every book in one response
+    resp = await request_with_retry(client, "POST", CLOB_BOOKS, json=[{"token_id": t} for t in token_ids])
+    try:
+        return {book["asset_id"]: parse_book(book) for book in orjson.loads(resp.content)}
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise httpx.DecodingError(f"Malformed /books response: {e!r}", request=resp.request) from e
+
+async def bounded(sem, coro):
+    async with sem:
+        return await coro
+
+async def fetch_all_books(client, token_ids):
+    sem = asyncio.Semaphore(BOOK_CONCURRENCY)
+    batches = await asyncio.gather(*[bounded(sem, fetch_books(client, c)) for c in chunks(token_ids, BOOKS_CHUNK)])
+    return {token: quote for batch in batches for token, quote in batch.items()}
+
+class Quote(NamedTuple):
+    # Top of a YES book; a compact tuple because one is kept per token in every cache and the live feed
+    best_ask: Optional[float]
+    best_bid: Optional[float]
+
+def parse_level(level):
+    # REST books and feed messages both send levels as {"price": "...", "size": "..."}
+    return float(level["price"]), float(level["size"])
+
+def parse_book(book):
+    asks = book.get("asks", [])
+    bids = book.get("bids", [])
+    # Take the best price explicitly, as the feed does, rather than trusting the API's level ordering
+    return Quote(
+        best_ask=min(parse_level(level)[0] for level in asks) if asks else None,
+        best_bid=max(parse_level(level)[0] for level in bids) if bids else None,
+    )
+
+@st.cache_data(ttl=QUOTES_TTL, show_spinner=False)
+def get_quotes_by_token(token_ids):
+    # token_ids is a tuple so it can serve as the cache key across auto-refresh ticks
+    return run_async(fetch_all_books(get_http_client(), list(token_ids)))
+
+class BookFeed:
+    # Keeps best quotes current from the CLOB market channel, so live scans read memory instead of
+    # polling REST on every tick. One socket per process carries the union of every live session's tokens
+    def __init__(self, loop):
+        self.quotes = {}
+        self.levels = {}
+        self.token_ids = ()
+        self.future = None
+        self.loop = loop
+        self.sessions = {}
+        self.lock = threading.Lock()
+        asyncio.run_coroutine_threadsafe(self.reap(), loop)
+
+    def subscribe(self, session_id, token_ids):
+        with self.lock:
+            self.sessions[session_id] = (frozenset(token_ids), time.monotonic())
+            self.resubscribe()
+
+    def unsubscribe(self, session_id):
+        with self.lock:
+            if self.sessions.pop(session_id, None) is not None:
+                self.resubscribe()
+
+    async def reap(self):
+        # Closed tabs never unsubscribe, so sessions that stop ticking age out and an idle feed shuts down
+        while True:
+            await asyncio.sleep(FEED_IDLE_SECS)
+            with self.lock:
+                self.resubscribe()
+
+    def resubscribe(self):
+        # Caller holds self.lock. Reconnect only when the union changes or the previous run has died
+        cutoff = time.monotonic() - FEED_IDLE_SECS
+        self.sessions = {sid: v for sid, v in self.sessions.items() if v[1] >= cutoff}
+        token_ids = tuple(sorted(frozenset().union(*(tokens for tokens, _ in self.sessions.values()))))
+        if token_ids == self.token_ids and (not token_ids or not self.future.done()):
+            return
+        if self.future:
+            self.future.cancel()
+            self.future = None
+        # The new subscription resends full books, so drop state for tokens no longer tracked
+        self.token_ids = token_ids
+        self.levels = {}
+        self.quotes = {}
+        if token_ids:
+            self.future = asyncio.run_coroutine_threadsafe(self.run(token_ids), self.loop)
+
+    async def run(self, token_ids):
+        while True:
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.ws_connect(CLOB_WS, heartbeat=10) as ws:
+                        await ws.send_json({"type": "market", "assets_ids": list(token_ids)})
+                        async for msg in ws:
+                            if msg.type != aiohttp.WSMsgType.TEXT:
+                                continue
+                            if token_ids is not self.token_ids:
+                                return
+                            try:
+                                self.handle(msg.json(loads=orjson.loads))
+                            except (ValueError, KeyError, TypeError, AttributeError):
+                                # Skip malformed frames rather than letting one kill the feed
+                                continue
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+            await asyncio.sleep(FEED_RECONNECT_SECS)
+
+    def handle(self, events):
+        for event in events if isinstance(events, list) else [events]:
+            kind = event.get("event_type")
+            if kind == "book":
+                # Full snapshot: replace the token's levels
+                token = event["asset_id"]
+                self.levels[token] = {
+                    "BUY": dict(map(parse_level, event.get("bids", []))),
+                    "SELL": dict(map(parse_level, event.get("asks", []))),
+                }
+                self.update_quote(token)
+            elif kind == "price_change":
+                # Deltas carry the new total size at a price level; size 0 removes the level
+                for change in event.get("price_changes") or event.get("changes", []):
+                    token = change.get("asset_id", event.get("asset_id"))
+                    book = self.levels.get(token)
+                    if book is None:
+                        continue
+                    side = book[change["side"]]
+                    price, size = parse_level(change)
+                    if size == 0:
+                        side.pop(price, None)
+                    else:
+                        side[price] = size
+                    self.update_quote(token)
+
+    def update_quote(self, token):
+        book = self.levels[token]
+        self.quotes[token] = Quote(
+            best_ask=min(book["SELL"]) if book["SELL"] else None,
+            best_bid=max(book["BUY"]) if book["BUY"] else None,
+        )
+
+@st.cache_resource
+def get_book_feed():
+    return BookFeed(get_event_loop())
 
-def get_best_asks(token_ids):
+def filter_markets(markets, min_volume):
+    # Dead or illiquid markets rarely have a book worth pricing, and markets with the orderbook
+    # disabled have none at all, so drop them before any orderbook traffic
+    return [
+        m for m in markets
+        if len(m["clobTokenIds"]) == 2
+        and m.get("enableOrderBook", True)
+        and float(m.get("volume") or 0) >= min_volume
+    ]
+
+def yes_token_ids(markets):
+    return tuple(dict.fromkeys(m["clobTokenIds"][0] for m in markets if len(m["clobTokenIds"]) == 2))
+
+def get_best_asks(quotes_by_token, token_ids):
+    # The CLOB mirrors YES and NO books: buying NO at p is selling YES at 1 - p,
+    # so the YES book alone gives both asks and the NO book never needs fetching
     if len(token_ids) != 2:
         return None, None
-    yes_token, no_token = token_ids
-    yes_resp = requests.get(f"{CLOB_ORDERBOOK}?token_id={yes_token}")
-    no_resp = requests.get(f"{CLOB_ORDERBOOK}?token_id={no_token}")
-    if yes_resp.status_code != 200 or no_resp.status_code != 200:
+    yes = quotes_by_token.get(token_ids[0])
+    if yes is None or yes.best_ask is None or yes.best_bid is None:
         return None, None
-    yes_book = yes_resp.json()
-    no_book = no_resp.json()
-    yes_asks = yes_book.get("asks", [])
-    no_asks = no_book.get("asks", [])
-    if not yes_asks or not no_asks:
-        return None, None
-    best_yes = float(min(yes_asks, key=lambda x: float(x[0]))[0])
-    best_no = float(min(no_asks, key=lambda x: float(x[0]))[0])
-    return best_yes, best_no
+    return yes.best_ask, 1 - yes.best_bid
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def match_pairs(questions):
+    # Match scores depend only on the question set, so price ticks and threshold changes reuse them.
+    # Scores are symmetric, so each block of MATCH_BLOCK rows is scored only against itself and later
+    # questions, keeping peak memory at MATCH_BLOCK x N and returning upper-triangle hits as (i, j, score)
+    processed = [utils.default_process(q) for q in questions]
+    hits = [(np.empty(0, np.intp), np.empty(0, np.intp), np.empty(0, np.uint8))]
+    for start in range(0, len(processed), MATCH_BLOCK):
+        scores = process.cdist(processed[start:start + MATCH_BLOCK], processed[start:], scorer=fuzz.token_sort_ratio,
+                               score_cutoff=75, dtype=np.uint8, workers=-1)
+        bi, bj = np.nonzero(scores)
+        upper = bi < bj
+        bi, bj = bi[upper], bj[upper]
+        hits.append((bi + start, bj + start, scores[bi, bj]))
+    pi, pj, ps = zip(*hits)
+    return np.concatenate(pi), np.concatenate(pj), np.concatenate(ps)
 
-def scan_for_opportunities(markets, spread_threshold=0.02, combo_threshold=0.02, near_certain=0.95, rules_keywords=["if", "by", "or", "unless", "before"]):
+def scan_for_opportunities(markets, quotes_by_token, spread_threshold=0.02, combo_threshold=0.02, near_certain=0.95, rules_keywords=["if", "by", "or", "unless", "before"]):
     spread_arbs = []
     combo_arbs = []
     near_certain_opps = []
     rules_arbs = []
     
-    questions = [m["question"] for m in markets if m.get("clobTokenIds")]
-    progress = st.progress(0)
-    total = len(markets)
+    valid = [m for m in markets if len(m["clobTokenIds"]) == 2]
+    questions = [m["question"] for m in valid]
+    pi, pj, pair_scores = match_pairs(tuple(questions))
     
-    for idx, market in enumerate(markets):
-        progress.progress((idx + 1) / total)
-        
-        clob_ids = market.get("clobTokenIds")
-        if not clob_ids or len(clob_ids) != 2:
-            continue
-        
-        yes_ask, no_ask = get_best_asks(clob_ids)
-        if yes_ask is None:
+    # Pack best asks into arrays (NaN where a book is missing) so the price checks run as vector ops
+    asks = [get_best_asks(quotes_by_token, m["clobTokenIds"]) for m in valid]
+    ya = np.fromiter((a[0] if a[0] is not None else np.nan for a in asks), dtype=np.float64, count=len(valid))
+    na = np.fromiter((a[1] if a[1] is not None else np.nan for a in asks), dtype=np.float64, count=len(valid))
+    
+    # 1. Spread/Rebalancing Arb
+    total_cost = ya + na
+    for i in np.where(total_cost < 1 - spread_threshold)[0]:
+        spread_arbs.append({
+            "Question": questions[i].lower(),
+            "YES Ask": ya[i],
+            "NO Ask": na[i],
+            "Total Cost": total_cost[i],
+            "Profit %": (1 - total_cost[i]) * 100,
+            "Volume": float(valid[i].get("volume") or 0)
+        })
+    
+    # 2. Combinatorial/Cross-Market Arb
+    # Price both legs of every matched pair at once
+    leg_a = 1 - (ya[pi] + na[pj])
+    leg_b = 1 - (na[pi] + ya[pj])
+    for k in np.where((leg_a > combo_threshold) | (leg_b > combo_threshold))[0]:
+        i, j = pi[k], pj[k]
+        question = questions[i].lower()
+        if questions[j].lower() == question:
             continue
-        
-        question = market["question"].lower()
-        
-        # 1. Spread/Rebalancing Arb
-        total_cost = yes_ask + no_ask
-        if total_cost < 1 - spread_threshold:
-            profit = 1 - total_cost
-            spread_arbs.append({
-                "Question": question,
-                "YES Ask": yes_ask,
-                "NO Ask": no_ask,
-                "Total Cost": total_cost,
-                "Profit %": profit * 100,
-                "Volume": market.get("volume", 0)
-            })
-        
-        # 2. Combinatorial/Cross-Market Arb
-        matches = process.extract(question, questions, limit=5, scorer=fuzz.token_sort_ratio)
-        for match_q, score in matches:
-            if score < 75 or match_q.lower() == question:
-                continue
-            linked = next(m for m in markets if m["question"].lower() == match_q.lower())
-            linked_yes, linked_no = get_best_asks(linked.get("clobTokenIds", []))
-            if linked_yes is None:
-                continue
-            if yes_ask + linked_no < 1 - combo_threshold or no_ask + linked_yes < 1 - combo_threshold:
-                profit = min(1 - (yes_ask + linked_no), 1 - (no_ask + linked_yes))
-                combo_arbs.append({
-                    "Base Question": question,
-                    "Linked Question": linked["question"],
-                    "Profit %": profit * 100,
-                    "Match Score": score
-                })
-        
-        # 3. Near-Certain Outcomes
-        if yes_ask <= 1 - near_certain or no_ask <= 1 - near_certain:
-            cheap_side = "YES" if yes_ask <= 1 - near_certain else "NO"
-            cheap_price = yes_ask if cheap_side == "YES" else no_ask
-            profit = (1 - cheap_price) * 100
-            near_certain_opps.append({
-                "Question": question,
-                "Cheap Side": cheap_side,
-                "Price": cheap_price,
-                "Implied Prob %": (1 - cheap_price) * 100 if cheap_side == "NO" else cheap_price * 100,
-                "Profit %": profit,
-                "Volume": market.get("volume", 0)
-            })
+        combo_arbs.append({
+            "Base Question": question,
+            "Linked Question": valid[j]["question"],
+            "Profit %": min(leg_a[k], leg_b[k]) * 100,
+            "Match Score": int(pair_scores[k])
+        })
+    
+    # 3. Near-Certain Outcomes
+    cheap_yes = ya <= 1 - near_certain
+    for i in np.where(cheap_yes | (na <= 1 - near_certain))[0]:
+        cheap_side = "YES" if cheap_yes[i] else "NO"
+        cheap_price = ya[i] if cheap_side == "YES" else na[i]
+        near_certain_opps.append({
+            "Question": questions[i].lower(),
+            "Cheap Side": cheap_side,
+            "Price": cheap_price,
+            "Implied Prob %": (1 - cheap_price) * 100 if cheap_side == "NO" else cheap_price * 100,
+            "Profit %": (1 - cheap_price) * 100,
+            "Volume": float(valid[i].get("volume") or 0)
+        })
+    
+    # One precompiled pass per question instead of a substring scan per keyword
+    keywords = [kw for kw in rules_keywords if kw]
+    rules_re = re.compile(r"\b(" + "|".join(map(re.escape, keywords)) + r")\b", re.I) if keywords else None
+    
+    # Only this cheap regex pass is still per-market; the slow fetch and match stages sit under the spinners,
+    # so a progress bar here would only add browser round-trips
+    for idx in np.where(~np.isnan(ya))[0]:
+        market = valid[idx]
+        yes_ask, no_ask = ya[idx], na[idx]
+        question = questions[idx].lower()
         
         # 4. Rules-Based Arb (Ambiguous)
-        if any(word in question for word in rules_keywords):
+        found = rules_re.findall(question) if rules_re else []
+        if found:
             rules_arbs.append({
                 "Question": question,
-                "Potential Ambiguity": ", ".join(word for word in rules_keywords if word in question),
+                "Potential Ambiguity": ", ".join(dict.fromkeys(found)),
                 "YES Ask": yes_ask,
                 "NO Ask": no_ask,
-                "Volume": market.get("volume", 0)
+                "Volume": float(market.get("volume") or 0)
             })
     
-    progress.empty()
+    for arbs in (spread_arbs, combo_arbs, near_certain_opps):
+        arbs.sort(key=itemgetter("Profit %"), reverse=True)
     return spread_arbs, combo_arbs, near_certain_opps, rules_arbs
 
+def show_table(rows, formats):
+    # Rows keep raw numbers for sorting; formatting happens only on the way to the page
+    st.table(pd.DataFrame(rows).style.format(formats))
+
 # Dashboard
 st.set_page_config(page_title="Polymarket Arb MVP", layout="wide")
 st.title("🔍 Polymarket Arbitrage MVP Dashboard")
@@ -132,44 +391,87 @@ col1, col2 = st.columns(2)
 with col1:
     spread_thresh = st.slider("Spread Threshold %", 0.5, 5.0, 2.0) / 100
     combo_thresh = st.slider("Combinatorial Threshold %", 0.5, 5.0, 2.0) / 100
+    min_volume = st.slider("Min market volume ($)", 0, 100000, 1000)
 with col2:
     near_cert = st.slider("Near-Certain Prob %", 90.0, 99.0, 95.0) / 100
     rules_kw = st.text_input("Rules Ambiguity Keywords (comma-separated)", "if,by,or,unless,before").split(",")
 
-if st.button("🚀 Scan All Opportunities Now", type="primary"):
+force_refresh = st.button("♻️ Force Refresh")
+if force_refresh:
+    # Drop the cached data and the scored snapshot so the page never shows pre-refresh results
+    fetch_all_markets.clear()
+    get_quotes_by_token.clear()
+    st.session_state.pop("snapshot", None)
+
+live = st.checkbox("🔄 Live scan from the WebSocket feed (refreshes every second)")
+feed_session = st.session_state.setdefault("feed_session", uuid.uuid4().hex)
+if not live and st.session_state.pop("feed_live", False):
+    get_book_feed().unsubscribe(feed_session)
+# Browser-side timer, so the script thread is never parked in a sleep between ticks
+tick = st_autorefresh(interval=LIVE_REFRESH_SECS * 1000, key="arb_refresh") if live else None
+# Widget interactions also rerun the script; in live mode only a new timer tick triggers a scan
+new_tick = live and tick != st.session_state.get("last_tick")
+st.session_state["last_tick"] = tick
+
+if st.button("🚀 Scan All Opportunities Now", type="primary") or new_tick or force_refresh:
     with st.spinner("Fetching markets..."):
-        markets = fetch_all_markets()
+        try:
+            markets = fetch_all_markets()
+        except httpx.HTTPError as e:
+            st.error(f"API Error: {e}")
+            markets = []
         st.info(f"Loaded {len(markets)} markets.")
     
+    yes_tokens = yes_token_ids(filter_markets(markets, min_volume))
+    if live:
+        feed = get_book_feed()
+        # A failed market fetch leaves no tokens; keep the last subscription rather than tearing it down
+        if yes_tokens:
+            feed.subscribe(feed_session, yes_tokens)
+            st.session_state["feed_live"] = True
+        # The feed carries every live session's tokens, so keep only this scan's
+        quotes = feed.quotes
+        quotes_by_token = {t: quotes[t] for t in yes_tokens if t in quotes}
+        st.caption(f"Live books: {len(quotes_by_token)}/{len(yes_tokens)}")
+    else:
+        try:
+            quotes_by_token = get_quotes_by_token(yes_tokens)
+        except httpx.HTTPError as e:
+            st.error(f"Orderbook Error: {e}")
+            quotes_by_token = {}
+    # Keep the fetched snapshot so slider and keyword changes only re-score it instead of re-fetching
+    st.session_state["snapshot"] = (markets, quotes_by_token)
+
+if "snapshot" in st.session_state:
+    markets, quotes_by_token = st.session_state["snapshot"]
+    scanned = filter_markets(markets, min_volume)
+    st.caption(f"Skipped {len(markets) - len(scanned)} non-binary, book-less or low-volume markets.")
+    
     with st.spinner("Scanning for all arb types..."):
-        spread, combo, near, rules = scan_for_opportunities(markets, spread_thresh, combo_thresh, near_cert, [kw.strip().lower() for kw in rules_kw])
+        spread, combo, near, rules = scan_for_opportunities(scanned, quotes_by_token, spread_thresh, combo_thresh, near_cert, [kw.strip().lower() for kw in rules_kw])
     
     if spread:
         st.success(f"Found {len(spread)} Spread Arbs!")
-        st.table(spread)
+        show_table(spread, {"YES Ask": "${:.4f}", "NO Ask": "${:.4f}", "Total Cost": "${:.4f}", "Profit %": "{:.2f}%", "Volume": "${:,.0f}"})
     else:
         st.warning("No Spread Arbs.")
     
     if combo:
         st.success(f"Found {len(combo)} Combinatorial Arbs!")
-        st.table(combo)
+        show_table(combo, {"Profit %": "{:.2f}%"})
     else:
         st.warning("No Combinatorial Arbs.")
     
     if near:
         st.success(f"Found {len(near)} Near-Certain Opps!")
-        st.table(near)
+        show_table(near, {"Price": "${:.4f}", "Implied Prob %": "{:.2f}%", "Profit %": "{:.2f}%", "Volume": "${:,.0f}"})
     else:
         st.warning("No Near-Certain Opps.")
     
     if rules:
         st.success(f"Found {len(rules)} Potential Rules Arbs (manual review needed)!")
-        st.table(rules)
+        show_table(rules, {"YES Ask": "${:.4f}", "NO Ask": "${:.4f}", "Volume": "${:,.0f}"})
     else:
         st.warning("No Rules Arbs flagged.")
 
-if st.checkbox("🔄 Auto-scan every 60s"):
-    time.sleep(60)
-    st.experimental_rerun()
-
 st.info("Manual execution: Buy flagged sides on Polymarket.com. For rules arbs, research resolution disputes.")